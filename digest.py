@@ -0,0 +1,199 @@
+# digest.py ------------------------------------------------------------
+"""
+Digest delivery: instead of one email per completed assessment, collect
+completions and send a single message once either
+  • ``max_count`` assessments are waiting, or
+  • ``window_s`` seconds have passed since the first one arrived.
+
+The message holds a summary table of everyone in the batch (from each
+entry's ``ScoreSummary``) and each person's PDF report as its own
+attachment.  Each queued report is also written to the results DB
+(``results_store.queue_digest``) and only dropped once its digest is
+sent, so a crash or kill inside the window loses nothing: the next
+server process re‑queues it (one server per results DB is assumed).
+A batch that keeps failing to send is kept in memory for
+``max_attempts`` tries, then left on disk for the next start.
+
+Immediate delivery stays the default; switch in ``secrets.toml``:
+
+[email]
+delivery = "digest"
+digest_max_count = 25
+digest_window_minutes = 60
+"""
+
+import atexit
+import re
+import threading
+from email.mime.application import MIMEApplication
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from html import escape
+
+from results_store import RESULTS_DB, digest_sent, pending_digest, queue_digest
+from score_summary import ScoreSummary
+
+# precompiled row formats for the summary table (no tabulate needed)
+_HEADERS = ("#", "Name", "Email", "Completed", "Most D/I/S/C",
+            "Least D/I/S/C", "Change D/I/S/C")
+_TEXT_ROW = "{:>3}  {:<24}  {:<32}  {:<12}  {:<13}  {:<13}  {:<14}".format
+_HTML_ROW = ("<tr><td>{}</td><td>{}</td><td>{}</td><td>{}</td>"
+             "<td>{}</td><td>{}</td><td>{}</td></tr>").format
+
+
+def _rows(batch):
+    for i, e in enumerate(batch, start=1):
+        summary = e["summary"]
+        yield (i, e["name"], e["email"], e["completed_at"].strftime("%d-%b %H:%M"),
+               summary.compact("most"), summary.compact("least"),
+               summary.compact("change"))
+
+
+def build_digest_message(batch):
+    """Assemble the digest email (From/To are set by the sender)."""
+    text_rows, html_rows = [_TEXT_ROW(*_HEADERS)], []
+    for row in _rows(batch):
+        text_rows.append(_TEXT_ROW(*row))
+        html_rows.append(_HTML_ROW(*(escape(str(v)) for v in row)))
+    head = "".join(f"<th>{h}</th>" for h in _HEADERS)
+    text_table = "\n".join(text_rows)
+    html_table = (f"<table>\n<thead>\n<tr>{head}</tr>\n</thead>\n<tbody>\n"
+                  + "\n".join(html_rows) + "\n</tbody>\n</table>")
+
+    text = f"""
+    DISC Assessment digest: {len(batch)} completed assessment(s).
+
+{text_table}
+
+    Individual PDF reports are attached.
+    """
+
+    html = f"""
+    <html><body><p>DISC Assessment digest: {len(batch)} completed assessment(s).</p>
+    {html_table}
+    <p>Individual PDF reports are attached.</p>
+    </body></html>
+    """
+
+    message = MIMEMultipart("mixed")
+    message['Subject'] = f"DISC Assessment Results Digest | {len(batch)} completed"
+
+    message_alternative = MIMEMultipart("alternative")
+    message.attach(message_alternative)
+    message_alternative.attach(MIMEText(text, 'plain'))
+    message_alternative.attach(MIMEText(html, 'html'))
+
+    for i, e in enumerate(batch, start=1):
+        safe = re.sub(r"[^A-Za-z0-9]+", "_", e["name"]).strip("_") or "respondent"
+        part = MIMEApplication(e["pdf"], _subtype='pdf')
+        part.add_header('Content-Disposition', 'attachment',
+                        filename=f"DISC_Report_{i:03d}_{safe}.pdf")
+        message.attach(part)
+
+    return message
+
+
+class DigestQueue:
+    """Thread‑safe buffer of completed assessments, flushed by count or time."""
+
+    def __init__(self, send, *, max_count=25, window_s=3600, max_attempts=3,
+                 db_path=RESULTS_DB):
+        self._send = send                 # callable(message) → delivers it
+        self.max_count = max_count
+        self.window_s = window_s
+        self.max_attempts = max_attempts
+        self.db_path = db_path
+        self._pending = []
+        self._timer = None
+        self._lock = threading.Lock()
+
+    def add(self, entry: dict) -> None:
+        """
+        Queue one completion.  Raises if it cannot be persisted, so the
+        caller can send it directly instead of holding it only in memory.
+
+        entry : dict – result_id (results_store row), name, email,
+                       completed_at (datetime), summary (ScoreSummary),
+                       pdf (bytes)
+        """
+        queue_digest(entry["result_id"], entry["pdf"], db_path=self.db_path)
+        with self._lock:
+            self._pending.append(entry)
+            if len(self._pending) < self.max_count:
+                self._arm()
+                return
+            batch = self._take()
+        self._deliver(batch)
+
+    def restore(self) -> None:
+        """Re‑queue reports an earlier server process never got to send."""
+        entries = pending_digest(db_path=self.db_path)
+        for e in entries:
+            e["summary"] = ScoreSummary(e.pop("most"), e.pop("least"))
+        if entries:
+            print(f'Digest: {len(entries)} unsent report(s) restored')
+            with self._lock:
+                self._pending[:0] = entries
+                self._arm()
+
+    def flush(self) -> None:
+        """Send whatever is waiting now (timer expiry, shutdown)."""
+        with self._lock:
+            batch = self._take()
+        if batch:
+            self._deliver(batch)
+
+    def _arm(self):
+        # caller holds the lock
+        if self._timer is None:
+            self._timer = threading.Timer(self.window_s, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _take(self):
+        # caller holds the lock
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        return batch
+
+    def _deliver(self, batch):
+        try:
+            self._send(build_digest_message(batch))
+        except Exception as exc:
+            # retry with the next flush, but not forever: the PDFs stay in
+            # the results DB and are restored on the next start
+            for e in batch:
+                e["attempts"] = e.get("attempts", 0) + 1
+            retry = [e for e in batch if e["attempts"] < self.max_attempts]
+            print(f'Digest email failed ({exc}); {len(retry)} re-queued,'
+                  f' {len(batch) - len(retry)} left for the next start')
+            if retry:
+                with self._lock:
+                    self._pending[:0] = retry
+                    self._arm()
+            return
+        print(f'Digest email sent ({len(batch)} assessments)')
+        try:
+            digest_sent([e["result_id"] for e in batch], db_path=self.db_path)
+        except Exception as exc:
+            print('Digest sent but not marked, may be resent on next start:', exc)
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_digest_queue(send, **config) -> DigestQueue:
+    """Return the server‑wide queue, creating it on first use."""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = DigestQueue(send, **config)
+            atexit.register(_queue.flush)
+            try:
+                _queue.restore()
+            except Exception as exc:
+                print('Digest restore failed:', exc)
+        return _queue
@@ -18,6 +18,8 @@ from datetime import date
 from pathlib import Path
 from reportlab.lib.utils import ImageReader
 
+from timing import fmt_duration
+
 PAGE_W, PAGE_H = letter                       # 612 × 792 pt
 MARGIN_X = 36                                  # 0.5‑inch side margin
 LINE_W_THIN = 0.6                              # default stroke width
@@ -153,7 +155,8 @@ def draw_client_layer(c: canvas.Canvas,
                       *,
                       user: dict,
                       graphs: dict | None = None,
-                      scores: dict | None = None):
+                      scores: dict | None = None,
+                      timings: dict | None = None):
 
     ## --- text fields -------------------------------------------------
     c.setFont("Helvetica", 9)
@@ -190,6 +193,25 @@ def draw_client_layer(c: canvas.Canvas,
                 "" if key=="change" else row["Total"]   
             ]
             _draw_score_row(c, vals, y_mid, table_left, col_w)
+
+    # completion time row (in the blank line under the table) ---------
+    if timings:
+        y = PAGE_H - 150 - 3 * 36 - 14
+        label = f"Completion time: {fmt_duration(timings.get('total'))}"
+        c.setFont("Helvetica-Bold", 7)
+        c.drawString(MARGIN_X, y, label)
+        # per-section times, wrapped onto a second line if they overrun
+        x0 = MARGIN_X + c.stringWidth(label, "Helvetica-Bold", 7) + 12
+        parts = [fmt_duration(s) for s in timings.get("sections", [])]
+        line = "per section:  " + "  ".join(parts)
+        c.setFont("Helvetica", 6)
+        if c.stringWidth(line, "Helvetica", 6) <= PAGE_W - MARGIN_X - x0:
+            c.drawString(x0, y, line)
+        else:
+            half = (len(parts) + 1) // 2
+            c.drawString(x0, y, "per section:  " + "  ".join(parts[:half]))
+            c.drawString(x0, y - 7, "  ".join(parts[half:]))
+        c.setFont("Helvetica", 9)
     ## --- embed PNG graphs -------------------------------------------
     g_w, g_h = 150, 200
     g_gap = 16
@@ -218,12 +240,14 @@ def build_pdf(*,
               user: dict,
               graphs: dict | None = None,
               scores: dict | None = None,
+              timings: dict | None = None,
               out_path: str = "DISC_Draft.pdf") -> str:
     """
     Parameters
     ----------
     user   : dict  – required keys: name, profile, date, gender
     graphs : dict  – keys 'most' 'least' 'change' → PNG paths (optional)
+    timings : dict – total / per‑section seconds, shown under the table (optional)
     out_path : str – where to write the PDF
 
     Returns
@@ -232,7 +256,7 @@ def build_pdf(*,
     """
     c = canvas.Canvas(out_path, pagesize=letter)
     draw_static_page(c)
-    draw_client_layer(c, user=user, graphs=graphs, scores=scores)
+    draw_client_layer(c, user=user, graphs=graphs, scores=scores, timings=timings)
     c.showPage()
     c.save()
     abs_path = str(Path(out_path).resolve())
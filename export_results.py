@@ -0,0 +1,127 @@
+# export_results.py ----------------------------------------------------
+"""
+Stream every stored assessment (results_store.py) to CSV, JSONL or
+Parquet.  Rows are read and written one chunk at a time, so memory stays
+flat however large the table gets.
+
+Full export / incremental nightly export:
+------------------------------------------------------------------
+python export_results.py results.csv
+python export_results.py results.parquet --format parquet
+python export_results.py new.jsonl --format jsonl --state-file .export_state
+------------------------------------------------------------------
+With ``--state-file`` the last exported row ``id`` is saved after a
+successful run and only rows with a higher id are read next time.
+``--since`` filters by completion time and is meant for the first run.
+
+Parquet output needs ``pip install pyarrow``.
+"""
+
+import argparse
+import csv
+import json
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+from results_store import COLUMNS, RESULTS_DB, iter_results
+
+
+def _utc_iso(ts: str) -> str:
+    """Normalise a user‑supplied timestamp to the stored UTC ISO form."""
+    dt = datetime.fromisoformat(ts)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc).isoformat()
+
+# ----------------------------------------------------------------------
+# writers: each takes the chunk iterator and returns the last row seen
+# ----------------------------------------------------------------------
+
+def _write_csv(chunks, out):
+    last = None
+    with open(out, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(COLUMNS))
+        writer.writeheader()
+        for chunk in chunks:
+            writer.writerows(chunk)
+            last = chunk[-1]
+    return last
+
+
+def _write_jsonl(chunks, out):
+    last = None
+    with open(out, "w", encoding="utf-8") as f:
+        for chunk in chunks:
+            f.writelines(json.dumps(row) + "\n" for row in chunk)
+            last = chunk[-1]
+    return last
+
+
+def _write_parquet(chunks, out):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise SystemExit("Parquet export needs pyarrow: pip install pyarrow")
+
+    types = {
+        "int64": pa.int64(),
+        "int32": pa.int32(),
+        "float64": pa.float64(),
+        "string": pa.string(),
+        "date": pa.date32(),
+        "timestamp": pa.timestamp("us", tz="UTC"),
+    }
+    schema = pa.schema([(name, types[t]) for name, t in COLUMNS.items()])
+    converters = {
+        "timestamp": datetime.fromisoformat,
+        "date": date.fromisoformat,
+    }
+
+    last = None
+    with pq.ParquetWriter(out, schema) as writer:
+        for chunk in chunks:
+            # one row group per chunk, built column by column
+            arrays = []
+            for name, t in COLUMNS.items():
+                conv = converters.get(t)
+                col = [row[name] for row in chunk]
+                if conv:
+                    col = [conv(v) if v else None for v in col]
+                arrays.append(pa.array(col, type=schema.field(name).type))
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+            last = chunk[-1]
+    return last
+
+
+WRITERS = {"csv": _write_csv, "jsonl": _write_jsonl, "parquet": _write_parquet}
+
+
+def export(out, *, fmt="csv", after_id=0, since=None, chunk_size=1000,
+           db_path=RESULTS_DB):
+    """Export results to ``out``; returns the last row ``id`` written."""
+    chunks = iter_results(after_id=after_id,
+                          since=_utc_iso(since) if since else None,
+                          chunk_size=chunk_size, db_path=db_path)
+    last = WRITERS[fmt](chunks, out)
+    return last["id"] if last else None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export stored DISC results.")
+    parser.add_argument("out", help="output file")
+    parser.add_argument("--format", choices=WRITERS, default="csv")
+    parser.add_argument("--since", help="only results completed after this ISO timestamp (first run)")
+    parser.add_argument("--state-file", help="read/write the last exported row id here")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--db", default=RESULTS_DB)
+    args = parser.parse_args()
+
+    state = Path(args.state_file) if args.state_file else None
+    after_id = int(state.read_text().strip() or 0) if state and state.exists() else 0
+
+    last_id = export(args.out, fmt=args.format, after_id=after_id, since=args.since,
+                     chunk_size=args.chunk_size, db_path=args.db)
+    if last_id and state:
+        state.write_text(str(last_id))
+    print(f"Exported to {args.out}" + (f" (up to id {last_id})" if last_id else " (no new results)"))
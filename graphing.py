@@ -22,6 +22,7 @@ in *playground.py*.
 import numpy as np
 import matplotlib.pyplot as plt
 
+from matplotlib.collections import LineCollection
 from matplotlib.patches import Rectangle
 import itertools
 
@@ -45,6 +46,26 @@ GRAPHLABELS_CHANGE = {
     'C': [-22,-19,-15,-13,-10,-9,-8,-7,-6,-5,-4,-3,-2,-1,0,+1,+2,+3,+4,+5,+6,+10,+17],
 }
 
+# y-position of every score on each graph (index = score, or score+24 for CHANGE)
+MAPPINGS_MOST = {
+    'D': [9, 14, 20, 28, 32, 35, 39, 43, 45, 50, 55, 57, 59, 64, 66, 73, 75, 76, 76, 76, 76, 77, 78, 79, 80],
+    'I': [4, 16, 28, 35, 45, 55, 57, 66, 68, 70, 73, 75, 76, 76, 76, 76, 76, 76, 76, 77, 77, 78, 78, 79, 80],
+    'S': [12, 18, 22, 32, 37, 43, 45, 53, 55, 59, 64, 66, 68, 70, 73, 73, 74, 74, 75, 76, 77, 78, 79, 80, 80],
+    'C': [9, 16, 22, 32, 43, 50, 55, 66, 68, 70, 71, 73, 74, 75, 75, 76, 76, 77, 77, 78, 78, 79, 79, 80, 80]
+}
+MAPPINGS_LEAST = {
+    'D': [3, 7, 18, 27, 33, 37, 42, 46, 47, 53, 55, 58, 62, 66, 68, 71, 73, 74, 75, 76, 77, 78, 79, 79, 80],
+    'I': [5, 10, 21, 27, 37, 42, 50, 58, 63, 66, 71, 73, 75, 77, 77, 78, 78, 78, 79,79, 79, 80, 80, 80, 80],
+    'S': [3, 5, 10, 21, 27, 33, 37, 46, 50, 55, 63, 66, 71, 73, 74, 75, 76, 77, 78, 79, 80, 80, 80, 80, 80],
+    'C': [3, 5, 13, 21, 27, 33, 37, 42, 46, 53, 57, 66, 68, 71, 73, 75, 76, 77, 78, 79, 79, 80, 80, 80, 80]
+}
+MAPPINGS_CHANGE = {
+    'D': [0, 1, 2, 3, 4, 4, 5, 5, 6, 8, 10, 11, 12, 18, 23, 24, 25, 27, 30, 32, 34, 36, 37, 38, 38, 43, 44, 45, 46, 47, 50, 53, 56, 59, 64, 65, 66, 68, 70, 72, 73, 73, 74, 75, 76, 77, 78, 78, 79, 80 ],
+    'I': [0, 1, 1, 2, 3, 4, 4, 4, 5, 5, 5, 6, 6, 6, 9, 12, 16, 18, 23, 25, 30, 32, 38, 41, 43, 45, 47, 55, 59, 62, 66, 68, 72, 73, 75, 75, 75, 75, 76, 76, 76, 76, 77, 77, 77, 78, 78, 79, 79, 80],
+    'S': [0, 0, 0, 1, 1, 1, 2, 2, 3, 3, 5, 6, 7, 8, 9, 16, 18, 23, 25, 30, 32, 34, 36, 38, 45, 48, 50, 55, 57, 59, 62, 64, 66, 68, 70, 72, 73, 74, 75, 75, 76, 76, 76, 77, 77, 77, 77, 78, 79, 80],
+    'C': [0, 1, 1, 2, 3, 4, 4, 5, 5, 6, 7, 9, 10, 11, 12, 16, 18, 23, 25, 27, 36, 38, 43, 45, 48, 55, 59, 62, 68, 69, 70, 71, 72, 72, 73, 74, 75, 75, 76, 76, 77, 77, 78, 78, 78, 79, 79, 79, 80, 80]
+}
+
 # ------------------------------------------------------------------
 # small helpers for grid annotations
 # ------------------------------------------------------------------
@@ -99,6 +120,7 @@ __all__ = [
     "plot_disc_graph_most",
     "plot_disc_graph_least",
     "plot_disc_graph_change",
+    "plot_disc_graph_team",
 ]
 
 # ---------------------------------------------------------------------
@@ -167,12 +189,7 @@ def _style_ax(ax, *, invert=False, show_vals=False):
 def plot_disc_graph_most(values, ax):
     """Plot GRAPH 1 – MOST (values 0‑24)."""
     labels = "DISC"
-    mappings = {
-        'D': [9, 14, 20, 28, 32, 35, 39, 43, 45, 50, 55, 57, 59, 64, 66, 73, 75, 76, 76, 76, 76, 77, 78, 79, 80],
-        'I': [4, 16, 28, 35, 45, 55, 57, 66, 68, 70, 73, 75, 76, 76, 76, 76, 76, 76, 76, 77, 77, 78, 78, 79, 80],
-        'S': [12, 18, 22, 32, 37, 43, 45, 53, 55, 59, 64, 66, 68, 70, 73, 73, 74, 74, 75, 76, 77, 78, 79, 80, 80],
-        'C': [9, 16, 22, 32, 43, 50, 55, 66, 68, 70, 71, 73, 74, 75, 75, 76, 76, 77, 77, 78, 78, 79, 79, 80, 80]
-    }
+    mappings = MAPPINGS_MOST
     y = [mappings[L][v] for L, v in zip(labels, values)]
     x = np.arange(4)
 
@@ -196,12 +213,7 @@ def plot_disc_graph_most(values, ax):
 def plot_disc_graph_least(values, ax):
     """Plot GRAPH 2 – LEAST (values 0‑24, inverted axis)."""
     labels = "DISC"
-    mappings = {
-        'D': [3, 7, 18, 27, 33, 37, 42, 46, 47, 53, 55, 58, 62, 66, 68, 71, 73, 74, 75, 76, 77, 78, 79, 79, 80],
-        'I': [5, 10, 21, 27, 37, 42, 50, 58, 63, 66, 71, 73, 75, 77, 77, 78, 78, 78, 79,79, 79, 80, 80, 80, 80],
-        'S': [3, 5, 10, 21, 27, 33, 37, 46, 50, 55, 63, 66, 71, 73, 74, 75, 76, 77, 78, 79, 80, 80, 80, 80, 80],
-        'C': [3, 5, 13, 21, 27, 33, 37, 42, 46, 53, 57, 66, 68, 71, 73, 75, 76, 77, 78, 79, 79, 80, 80, 80, 80]
-    }
+    mappings = MAPPINGS_LEAST
     y = [mappings[L][v] for L, v in zip(labels, values)]
     x = np.arange(4)
 
@@ -226,13 +238,7 @@ def plot_disc_graph_change(values, ax):
     """Plot GRAPH 3 – CHANGE (values -24…+24)."""
     labels = "DISC"
     values24 = [v + 24 for v in values]   # shift into 0…48 index space
-    mappings = {
-        'D': [0, 1, 2, 3, 4, 4, 5, 5, 6, 8, 10, 11, 12, 18, 23, 24, 25, 27, 30, 32, 34, 36, 37, 38, 38, 43, 44, 45, 46, 47, 50, 53, 56, 59, 64, 65, 66, 68, 70, 72, 73, 73, 74, 75, 76, 77, 78, 78, 79, 80 ],
-        'I': [0, 1, 1, 2, 3, 4, 4, 4, 5, 5, 5, 6, 6, 6, 9, 12, 16, 18, 23, 25, 30, 32, 38, 41, 43, 45, 47, 55, 59, 62, 66, 68, 72, 73, 75, 75, 75, 75, 76, 76, 76, 76, 77, 77, 77, 78, 78, 79, 79, 80],
-        'S': [0, 0, 0, 1, 1, 1, 2, 2, 3, 3, 5, 6, 7, 8, 9, 16, 18, 23, 25, 30, 32, 34, 36, 38, 45, 48, 50, 55, 57, 59, 62, 64, 66, 68, 70, 72, 73, 74, 75, 75, 76, 76, 76, 77, 77, 77, 77, 78, 79, 80],
-        'C': [0, 1, 1, 2, 3, 4, 4, 5, 5, 6, 7, 9, 10, 11, 12, 16, 18, 23, 25, 27, 36, 38, 43, 45, 48, 55, 59, 62, 68, 69, 70, 71, 72, 72, 73, 74, 75, 75, 76, 76, 77, 77, 78, 78, 78, 79, 79, 79, 80, 80]
-    }
-
+    mappings = MAPPINGS_CHANGE
     y = [mappings[L][v] for L, v in zip(labels, values24)]
     x = np.arange(4)
 
@@ -247,3 +253,68 @@ def plot_disc_graph_change(values, ax):
         )
 
     return ax
+
+# ---------------------------------------------------------------------
+# 4. TEAM OVERLAY ------------------------------------------------------
+# ---------------------------------------------------------------------
+
+#  kind       mappings          colour     invert  index shift  grid numbers
+_TEAM_SPECS = {
+    "most":   (MAPPINGS_MOST,   "#1C80BC", False,  0,  _annotate_column_numbers,        GRAPHLABELS_MOST),
+    "least":  (MAPPINGS_LEAST,  "#A00100", True,   0,  _annotate_column_numbers,        GRAPHLABELS_LEAST),
+    "change": (MAPPINGS_CHANGE, "#278D8D", False,  24, _annotate_column_numbers_change, GRAPHLABELS_CHANGE),
+}
+
+# (4, n_scores) lookup tables so a whole team maps to y in one indexing op
+_TEAM_LOOKUP = {
+    kind: np.array([spec[0][L] for L in "DISC"])
+    for kind, spec in _TEAM_SPECS.items()
+}
+
+def plot_disc_graph_team(profiles, ax, *, kind="most", band=(25, 75)):
+    """
+    Overlay many profiles of one graph type on a single DISC chart.
+
+    Every profile goes into one LineCollection (a single artist), so the
+    draw cost barely moves between a team of 5 and a workshop of 500.
+    On top sit the team mean line and a shaded percentile band.
+
+    Parameters
+    ----------
+    profiles : array‑like (n, 4) – D/I/S/C scores, one row per person
+    ax       : matplotlib Axes
+    kind     : 'most' | 'least' | 'change'
+    band     : (lo, hi) percentiles for the density band
+    """
+    mappings, color, invert, shift, annotate, graphlabels = _TEAM_SPECS[kind]
+    table = _TEAM_LOOKUP[kind]
+
+    vals = np.asarray(profiles, dtype=int).reshape(-1, 4) + shift
+    y = table[np.arange(4), vals]             # (n, 4) y‑positions
+    x = np.arange(4)
+
+    _style_ax(ax, invert=invert)
+
+    if len(y):
+        segments = np.empty((len(y), 4, 2))
+        segments[..., 0] = x
+        segments[..., 1] = y
+        alpha = min(0.6, max(0.05, 8 / len(y)))   # fade as the team grows
+        ax.add_collection(LineCollection(segments, colors=color, lw=0.5,
+                                         alpha=alpha, zorder=1,
+                                         rasterized=True))
+
+        lo, hi = np.percentile(y, band, axis=0)
+        ax.fill_between(x, lo, hi, color=color, alpha=0.15, lw=0, zorder=0.5)
+        ax.plot(x, y.mean(axis=0), "o-", color=color,
+                lw=1.4, markersize=4, zorder=2)
+
+    for col, L in enumerate("DISC"):
+        annotate(
+            ax,
+            x_pos      = col,
+            mapping_rowlist = mappings[L],
+            label_list      = graphlabels[L],
+        )
+
+    return ax
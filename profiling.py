@@ -0,0 +1,145 @@
+# profiling.py ---------------------------------------------------------
+"""
+Opt‑in profiling of the completion path (scoring → graphs → PDF → email).
+
+Switch it on with either
+  • DISC_PROFILE=1                        (every completion), or
+  • ?profile=<DISC_PROFILE_TOKEN> in the URL (one admin session)
+
+Each wrapped run writes two files into DISC_PROFILE_DIR (default
+./profiles), keeping only the newest DISC_PROFILE_KEEP runs:
+  <stamp>-<label>-<pid>.prof  – cProfile stats
+  <stamp>-<label>-<pid>.tm    – tracemalloc snapshot
+
+Summarise the hotspots across all saved runs:
+------------------------------------------------------------------
+python profiling.py                   # top 20 functions + allocation sites
+python profiling.py --top 40 --label render
+------------------------------------------------------------------
+"""
+
+import argparse
+import cProfile
+import os
+import pstats
+import threading
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+PROFILE_DIR = os.environ.get("DISC_PROFILE_DIR", "profiles")
+KEEP_RUNS = int(os.environ.get("DISC_PROFILE_KEEP", 50))
+TRACE_FRAMES = 10
+
+
+def profiling_requested(query_params=None) -> bool:
+    """True if the env switch is on or the admin token is in the URL."""
+    if os.environ.get("DISC_PROFILE") == "1":
+        return True
+    token = os.environ.get("DISC_PROFILE_TOKEN")
+    return bool(token) and query_params is not None \
+        and query_params.get("profile") == token
+
+
+# tracemalloc is process‑wide and every Streamlit session is a thread in
+# the same process: trace while at least one profiled run is active
+_trace_users = 0
+_trace_owned = False              # True if we started it (so we may stop it)
+_trace_lock = threading.Lock()
+
+
+def _trace_acquire():
+    global _trace_users, _trace_owned
+    with _trace_lock:
+        if _trace_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start(TRACE_FRAMES)
+            _trace_owned = True
+        _trace_users += 1
+
+
+def _trace_release():
+    global _trace_users, _trace_owned
+    with _trace_lock:
+        _trace_users -= 1
+        if _trace_users == 0 and _trace_owned:
+            tracemalloc.stop()
+            _trace_owned = False
+
+
+@contextmanager
+def profile_run(label, *, enabled=True, out_dir=PROFILE_DIR):
+    """Profile the ``with`` body (CPU + memory) and dump one run to disk."""
+    if not enabled:
+        yield
+        return
+
+    _trace_acquire()
+    prof = cProfile.Profile()
+    prof.enable()
+    try:
+        yield
+    finally:
+        prof.disable()
+        # profiling must never break the completion it is watching
+        try:
+            snapshot = tracemalloc.take_snapshot() if tracemalloc.is_tracing() else None
+            out = Path(out_dir)
+            out.mkdir(parents=True, exist_ok=True)
+            stem = f"{datetime.now():%Y%m%d-%H%M%S-%f}-{label}-{os.getpid()}"
+            prof.dump_stats(out / f"{stem}.prof")
+            if snapshot is not None:
+                snapshot.dump(str(out / f"{stem}.tm"))
+            _rotate(out, KEEP_RUNS)
+        except Exception as exc:
+            print('Profiling dump failed:', exc)
+        finally:
+            _trace_release()
+
+
+def _rotate(out: Path, keep: int) -> None:
+    """Delete all but the newest ``keep`` runs (stems sort by timestamp)."""
+    stems = sorted({p.stem for p in out.glob("*.prof")})
+    for stem in stems[:-keep] if keep > 0 else []:
+        for ext in (".prof", ".tm"):
+            (out / f"{stem}{ext}").unlink(missing_ok=True)
+
+# ----------------------------------------------------------------------
+# CLI ------------------------------------------------------------------
+# ----------------------------------------------------------------------
+
+def summarize(out_dir=PROFILE_DIR, *, top=20, label=None):
+    out = Path(out_dir)
+    pattern = f"*-{label}-*" if label else "*"
+    profs = sorted(out.glob(f"{pattern}.prof"))
+    snaps = sorted(out.glob(f"{pattern}.tm"))
+    if not profs:
+        print(f"No profiling runs found in {out.resolve()}")
+        return
+
+    print(f"=== CPU: {len(profs)} run(s), by cumulative time ===")
+    stats = pstats.Stats(str(profs[0]))
+    for p in profs[1:]:
+        stats.add(str(p))
+    stats.strip_dirs().sort_stats("cumulative").print_stats(top)
+
+    # average bytes still held per allocation site across runs
+    sizes = defaultdict(int)
+    for s in snaps:
+        for stat in tracemalloc.Snapshot.load(str(s)).statistics("lineno"):
+            frame = stat.traceback[0]
+            sizes[f"{frame.filename}:{frame.lineno}"] += stat.size
+
+    print(f"=== Memory: {len(snaps)} snapshot(s), mean KiB per site ===")
+    for site, size in sorted(sizes.items(), key=lambda kv: -kv[1])[:top]:
+        print(f"{size / len(snaps) / 1024:10.1f}  {site}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Summarise DISC profiling runs.")
+    parser.add_argument("out_dir", nargs="?", default=PROFILE_DIR)
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--label", help="only runs with this label (scores, mail, render)")
+    args = parser.parse_args()
+    summarize(args.out_dir, top=args.top, label=args.label)
@@ -0,0 +1,227 @@
+# render_pool.py -------------------------------------------------------
+"""
+One process pool per Streamlit server that owns the CPU‑heavy part of
+the results page: the three matplotlib graphs and the reportlab PDF.
+
+Rendering is GIL‑bound, so running it on the script thread stalls every
+other session's reruns.  Jobs are pushed to worker processes instead:
+  • bounded queue  – at most ``max_pending`` jobs admitted at once
+  • admission      – ``submit`` waits ``admission_timeout`` s for a slot,
+                     then raises ``RenderPoolBusy``
+  • per‑job limit  – a job still running after ``job_timeout`` s kills its
+                     own worker (faulthandler watchdog, works even inside
+                     native code); ``wait`` gives up after the same time
+  • recovery       – a dead worker breaks the executor (its jobs, including
+                     any other sessions' jobs in flight, fail with
+                     ``BrokenProcessPool``); the next ``submit`` rebuilds it
+
+Tune with DISC_RENDER_WORKERS / DISC_RENDER_QUEUE / DISC_RENDER_TIMEOUT.
+
+Call pattern (example):
+------------------------------------------------------------------
+pool = get_render_pool()
+pdf_bytes = pool.run(render_report, user=user, values=values, scores=scores)
+------------------------------------------------------------------
+"""
+
+import faulthandler
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# Dimensions for DISC graphs in points (1 pt = 1 px @ 300 dpi)
+FIGSIZE_PT = (600, 800)
+FIGSIZE_IN = (FIGSIZE_PT[0] / 300, FIGSIZE_PT[1] / 300)
+
+DEFAULT_WORKERS = int(os.environ.get("DISC_RENDER_WORKERS", 2))
+DEFAULT_QUEUE = int(os.environ.get("DISC_RENDER_QUEUE", 8))
+DEFAULT_TIMEOUT = float(os.environ.get("DISC_RENDER_TIMEOUT", 60))
+
+
+class RenderPoolBusy(RuntimeError):
+    """Raised when no queue slot frees up within the admission timeout."""
+
+
+# ----------------------------------------------------------------------
+# 1 ─── JOBS (run inside the worker processes) ──────────────────────────
+# ----------------------------------------------------------------------
+
+def render_report(*, user: dict, values: dict, scores: dict,
+                  timings: dict | None = None, profile: bool = False) -> bytes:
+    """
+    Render the three DISC graphs and the PDF report.
+
+    Parameters
+    ----------
+    user   : dict – name, email, date, gender (as ``build_pdf`` expects)
+    values : dict – 'most' 'least' 'change' → list of 4 D/I/S/C scores
+    scores : dict – score table rows (as ``build_pdf`` expects)
+    timings : dict – total/per‑section seconds (see timing.py), optional
+    profile : bool – dump cProfile/tracemalloc for this job (see profiling.py)
+
+    Returns
+    -------
+    bytes – the finished PDF, so nothing is left behind in a shared /tmp
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    from disc_pdf import build_pdf
+    from graphing import (plot_disc_graph_change, plot_disc_graph_least,
+                          plot_disc_graph_most)
+    from profiling import profile_run
+
+    with profile_run("render", enabled=profile), \
+         tempfile.TemporaryDirectory(prefix="disc_") as tmp:
+        paths = {}
+        for key, fn in [
+            ("most",   plot_disc_graph_most),
+            ("least",  plot_disc_graph_least),
+            ("change", plot_disc_graph_change),
+        ]:
+            fig, ax = plt.subplots(figsize=FIGSIZE_IN, dpi=300)   # 1 pt == 1 px
+            fn(values[key], ax)
+            path = os.path.join(tmp, f"{key}.png")
+            fig.savefig(path, bbox_inches="tight", transparent=True)
+            plt.close(fig)
+            paths[key] = path
+
+        pdf_path = build_pdf(user=user, graphs=paths, scores=scores,
+                             timings=timings, out_path=os.path.join(tmp, "DISC_Report.pdf"))
+        with open(pdf_path, "rb") as f:
+            return f.read()
+
+
+def render_preview_svgs(*, values: dict) -> dict:
+    """
+    Render the three DISC graphs as compact SVG for the results page.
+
+    Text stays as text (no glyph paths) and metadata is dropped, so each
+    graph is a few KB and the markup is identical for identical scores.
+
+    Returns
+    -------
+    dict – 'most' 'least' 'change' → '<svg …>' markup
+    """
+    import io
+
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    from graphing import (plot_disc_graph_change, plot_disc_graph_least,
+                          plot_disc_graph_most)
+
+    svgs = {}
+    with plt.rc_context({"svg.fonttype": "none", "svg.hashsalt": "disc"}):
+        for key, fn in [
+            ("most",   plot_disc_graph_most),
+            ("least",  plot_disc_graph_least),
+            ("change", plot_disc_graph_change),
+        ]:
+            fig, ax = plt.subplots(figsize=FIGSIZE_IN)
+            fn(values[key], ax)
+            buf = io.StringIO()
+            fig.savefig(buf, format="svg", bbox_inches="tight",
+                        transparent=True, metadata={"Date": None})
+            plt.close(fig)
+            markup = buf.getvalue()
+            svgs[key] = markup[markup.index("<svg"):]   # drop XML prolog/doctype
+    return svgs
+
+
+def _run_limited(fn, limit, /, *args, **kwargs):
+    """Run ``fn`` in a worker; the worker exits if it overruns ``limit`` s."""
+    faulthandler.dump_traceback_later(limit, exit=True)   # traceback to stderr
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        faulthandler.cancel_dump_traceback_later()
+
+# ----------------------------------------------------------------------
+# 2 ─── POOL ────────────────────────────────────────────────────────────
+# ----------------------------------------------------------------------
+
+class RenderPool:
+    """Process pool with a bounded number of admitted jobs."""
+
+    def __init__(self, max_workers=DEFAULT_WORKERS, max_pending=DEFAULT_QUEUE,
+                 job_timeout=DEFAULT_TIMEOUT):
+        self.max_workers = max_workers
+        self._executor = self._new_executor()
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self.job_timeout = job_timeout
+
+    def _new_executor(self):
+        # spawn, not fork: the Streamlit server is multi‑threaded
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    def _replace(self, broken):
+        """Swap in a fresh executor if ``broken`` is still the current one."""
+        with _pool_lock:
+            if self._executor is broken:
+                self._executor = self._new_executor()
+                broken.shutdown(wait=False)
+            return self._executor
+
+    def submit(self, fn, /, *args, admission_timeout=5.0, **kwargs):
+        """Queue ``fn`` on a worker and return its Future."""
+        if not self._slots.acquire(timeout=admission_timeout):
+            raise RenderPoolBusy("render queue is full")
+        try:
+            executor = self._executor
+            try:
+                future = executor.submit(_run_limited, fn, self.job_timeout,
+                                         *args, **kwargs)
+            except BrokenProcessPool:
+                # a worker died (OOM kill, native crash, overrun): rebuild once
+                future = self._replace(executor).submit(
+                    _run_limited, fn, self.job_timeout, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        # a timed‑out job keeps its slot until it finishes or its worker exits
+        future.add_done_callback(lambda _f: self._slots.release())
+        return future
+
+    def run(self, fn, /, *args, timeout=None, **kwargs):
+        """Submit ``fn`` and block for its result (``TimeoutError`` on expiry)."""
+        return self.wait(self.submit(fn, *args, **kwargs), timeout=timeout)
+
+    def wait(self, future, *, timeout=None):
+        """
+        Block for ``future``; on timeout cancel it if it is still queued.
+
+        A job already running cannot be cancelled from here; it ends on
+        its own limit (``_run_limited``), at most ``job_timeout`` s after
+        it started.  Callers that retry should keep the Future and
+        ``wait`` on it again rather than submitting a second job.
+        """
+        try:
+            return future.result(timeout=timeout or self.job_timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_render_pool() -> RenderPool:
+    """Return the server‑wide pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = RenderPool()
+        return _pool
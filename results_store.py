@@ -0,0 +1,220 @@
+# results_store.py -----------------------------------------------------
+"""
+Local SQLite record of every completed assessment, so analysts are not
+limited to the emailed PDFs.  One row per completion:
+  • user details (name, email, date of birth, gender)
+  • raw answers  – the ``user_selections`` list, as JSON
+  • most / least / change score dicts, as JSON
+  • durations    – per‑section and total seconds (timing.py), as JSON
+
+``iter_results`` streams rows back in fixed‑size chunks, flattened into
+typed columns (see ``COLUMNS``), for export_results.py.
+
+``digest_pending`` holds the PDF of every report queued for a digest
+email (digest.py) until that email is sent, so a crash or kill inside
+the digest window loses nothing: the next server process re‑queues them.
+"""
+
+import json
+import os
+import sqlite3
+from datetime import datetime, timezone
+
+RESULTS_DB = os.environ.get("DISC_RESULTS_DB", "disc_results.sqlite3")
+N_SECTIONS = 24                 # matches mapping1 … mapping24
+DISC_KEYS = ("D", "I", "S", "C", "*")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+    completed_at  TEXT NOT NULL,          -- ISO‑8601, UTC
+    name          TEXT,
+    email         TEXT,
+    date_of_birth TEXT,                   -- ISO date
+    gender        TEXT,
+    answers       TEXT NOT NULL,          -- JSON list of selections
+    most          TEXT NOT NULL,          -- JSON score dicts
+    least         TEXT NOT NULL,
+    change        TEXT NOT NULL,
+    durations     TEXT                    -- JSON, see timing.py
+);
+CREATE INDEX IF NOT EXISTS results_completed_at ON results (completed_at);
+CREATE TABLE IF NOT EXISTS digest_pending (
+    result_id     INTEGER PRIMARY KEY REFERENCES results (id),
+    pdf           BLOB NOT NULL
+);
+"""
+
+# flattened export columns → type name (used for the Parquet schema)
+COLUMNS = {
+    "id": "int64",
+    "completed_at": "timestamp",
+    "name": "string",
+    "email": "string",
+    "date_of_birth": "date",
+    "gender": "string",
+    **{f"most_{k}": "int32" for k in DISC_KEYS},
+    "most_total": "int32",
+    **{f"least_{k}": "int32" for k in DISC_KEYS},
+    "least_total": "int32",
+    **{f"change_{k}": "int32" for k in DISC_KEYS[:4]},
+    "change_total": "int32",
+    "total_seconds": "float64",
+    **{f"q{i:02d}_{col}": "string"
+       for i in range(1, N_SECTIONS + 1) for col in ("most", "least")},
+    **{f"q{i:02d}_seconds": "float64" for i in range(1, N_SECTIONS + 1)},
+}
+
+
+def _connect(db_path):
+    conn = sqlite3.connect(db_path, timeout=10)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(_SCHEMA)
+    # databases created before timing capture lack the durations column
+    if "durations" not in {r[1] for r in conn.execute("PRAGMA table_info(results)")}:
+        conn.execute("ALTER TABLE results ADD COLUMN durations TEXT")
+    return conn
+
+
+def save_result(*, user: dict, selections: list, most: dict, least: dict,
+                durations: dict | None = None, db_path: str = RESULTS_DB) -> int:
+    """Store one completed assessment and return its row id."""
+    change = {k: most[k] - least[k] for k in DISC_KEYS[:4]}
+    dob = user.get("date_of_birth")
+    conn = _connect(db_path)
+    try:
+        with conn:
+            cur = conn.execute(
+                "INSERT INTO results (completed_at, name, email, date_of_birth,"
+                " gender, answers, most, least, change, durations)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    datetime.now(timezone.utc).isoformat(),
+                    user.get("name"),
+                    user.get("user_email"),
+                    dob.isoformat() if dob else None,
+                    user.get("gender"),
+                    json.dumps(selections),
+                    json.dumps(most),
+                    json.dumps(least),
+                    json.dumps(change),
+                    json.dumps(durations) if durations else None,
+                ),
+            )
+        return cur.lastrowid
+    finally:
+        conn.close()
+
+
+def _flatten(row):
+    (id_, completed_at, name, email, dob, gender,
+     answers, most, least, change, durations) = row
+    most, least, change = json.loads(most), json.loads(least), json.loads(change)
+
+    flat = {
+        "id": id_,
+        "completed_at": completed_at,
+        "name": name,
+        "email": email,
+        "date_of_birth": dob,
+        "gender": gender,
+    }
+    for prefix, scores in (("most", most), ("least", least)):
+        for k in DISC_KEYS:
+            flat[f"{prefix}_{k}"] = scores[k]
+        flat[f"{prefix}_total"] = sum(scores.values())
+    for k in DISC_KEYS[:4]:
+        flat[f"change_{k}"] = change[k]
+    flat["change_total"] = sum(change.values())
+
+    durations = json.loads(durations) if durations else {}
+    flat["total_seconds"] = durations.get("total")
+    sections = durations.get("sections") or []
+    for i in range(1, N_SECTIONS + 1):
+        flat[f"q{i:02d}_seconds"] = sections[i - 1] if i <= len(sections) else None
+
+    for i in range(1, N_SECTIONS + 1):
+        flat[f"q{i:02d}_most"] = flat[f"q{i:02d}_least"] = None
+    for sel in json.loads(answers):
+        i = sel["section"] + 1
+        flat[f"q{i:02d}_most"] = sel["most_likely"]
+        flat[f"q{i:02d}_least"] = sel["least_likely"]
+    return flat
+
+
+def iter_results(*, after_id: int = 0, since: str | None = None,
+                 chunk_size: int = 1000, db_path: str = RESULTS_DB):
+    """
+    Yield lists of flattened result dicts in insertion (``id``) order,
+    ``chunk_size`` at a time.
+
+    ``after_id`` is the incremental watermark: ids are assigned under the
+    SQLite write lock, so unlike ``completed_at`` (stamped before the
+    INSERT waits for it) they never commit out of order.  ``since`` (ISO
+    timestamp) is an extra filter, meant for a first export only.
+    """
+    conn = _connect(db_path)
+    try:
+        cur = conn.execute(
+            "SELECT id, completed_at, name, email, date_of_birth, gender,"
+            " answers, most, least, change, durations FROM results"
+            " WHERE id > ? AND completed_at > ? ORDER BY id",
+            (after_id, since or ""),
+        )
+        while True:
+            rows = cur.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield [_flatten(r) for r in rows]
+    finally:
+        conn.close()
+
+# ----------------------------------------------------------------------
+# reports waiting for the next digest email
+# ----------------------------------------------------------------------
+
+def queue_digest(result_id: int, pdf: bytes, *, db_path: str = RESULTS_DB) -> None:
+    """Keep a report's PDF until the digest containing it is sent."""
+    conn = _connect(db_path)
+    try:
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO digest_pending (result_id, pdf)"
+                         " VALUES (?, ?)", (result_id, pdf))
+    finally:
+        conn.close()
+
+
+def pending_digest(*, db_path: str = RESULTS_DB) -> list:
+    """Reports queued for a digest but never sent, oldest first."""
+    conn = _connect(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT r.id, r.completed_at, r.name, r.email, r.most, r.least, p.pdf"
+            " FROM digest_pending p JOIN results r ON r.id = p.result_id"
+            " ORDER BY r.id"
+        ).fetchall()
+    finally:
+        conn.close()
+    return [
+        {
+            "result_id":    id_,
+            "completed_at": datetime.fromisoformat(completed_at).astimezone(),
+            "name":         name,
+            "email":        email,
+            "most":         json.loads(most),
+            "least":        json.loads(least),
+            "pdf":          pdf,
+        }
+        for id_, completed_at, name, email, most, least, pdf in rows
+    ]
+
+
+def digest_sent(result_ids, *, db_path: str = RESULTS_DB) -> None:
+    """Drop the held PDFs once their digest email has gone out."""
+    conn = _connect(db_path)
+    try:
+        with conn:
+            conn.executemany("DELETE FROM digest_pending WHERE result_id = ?",
+                             [(i,) for i in result_ids])
+    finally:
+        conn.close()
@@ -1,4 +1,6 @@
 import streamlit as st
+from session_store import checkpoint
+from timing import stamp
 
 # Function to save user's selections for the current section
 def save_selections(idx):
@@ -10,9 +12,12 @@ def save_selections(idx):
         least_option = least_likely_key.split("_")[2]
 
         # Save the selection as a dictionary
-        st.session_state.user_selections.append({
+        selection = {
             "section": idx,
             "most_likely": most_option,
             "least_likely": least_option
-        })
+        }
+        st.session_state.user_selections.append(selection)
+        stamp(st.session_state.section_times, idx + 1)
+        checkpoint("section", selection=selection)  # append-only, survives restarts
         
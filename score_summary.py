@@ -0,0 +1,133 @@
+# score_summary.py -----------------------------------------------------
+"""
+One object per completed assessment holding every number the reports
+need – the Most / Least / Difference rows and their totals – computed
+once from the two ``disc_scores_*`` dicts.
+
+Everything downstream reads from it instead of re‑deriving the table:
+  • ``text_table`` / ``html_table`` – email bodies (grid + HTML table)
+  • ``pdf_scores``                  – the dict ``build_pdf`` expects
+  • ``values``                      – the D/I/S/C lists the graphs plot
+  • ``compact`` / ``as_dict``       – digest rows, JSON / API payloads
+
+Tables are filled from format strings compiled at import, so there is
+no pandas/tabulate on the delivery path.
+"""
+
+from html import escape
+from string import Template
+
+DISC = ("D", "I", "S", "C")
+STAR = "*"
+HEADERS = ("Category", "D", "I", "S", "C", "*", "Total")
+
+# ----------------------------------------------------------------------
+# precompiled templates
+# ----------------------------------------------------------------------
+_TEXT_SEP = "+--------------+-----+-----+-----+-----+-----+-------+"
+_TEXT_HEAD = "+==============+=====+=====+=====+=====+=====+=======+"
+_TEXT_ROW = "| {:<12} | {:>3} | {:>3} | {:>3} | {:>3} | {:>3} | {:>5} |".format
+_HTML_ROW = ("<tr><td>{}</td><td>{}</td><td>{}</td><td>{}</td>"
+             "<td>{}</td><td>{}</td><td>{}</td></tr>").format
+
+EMAIL_TEXT = Template("""
+    This is confirmation of the completion of the DISC Assessment by $name.
+
+    Contact $name email: $email.
+    Date of Birth: $date_of_birth
+    Gender: $gender
+    Completion time: $completion_time
+    Section times: $section_times
+
+    DISC Results:
+
+$table
+
+    """)
+
+EMAIL_HTML = Template("""
+    <html><body><p>This is confirmation of the completion of the DISC Assessment by $name.</p>
+    <p>Email: $email</p>
+    <p>Date of Birth: $date_of_birth</p>
+    <p>Gender: $gender</p>
+    <p>Completion time: $completion_time</p>
+    <p><small>Section times: $section_times</small></p>
+    $table
+    <p>See attached PDF for the plotted DISC scores.</p>
+    </body></html>
+    """)
+
+
+class ScoreSummary:
+    """Most / Least / Difference rows for one respondent."""
+
+    __slots__ = ("most", "least", "change", "rows")
+
+    def __init__(self, most: dict, least: dict):
+        self.most = {k: most[k] for k in (*DISC, STAR)}
+        self.least = {k: least[k] for k in (*DISC, STAR)}
+        self.change = {k: most[k] - least[k] for k in DISC}
+
+        # (label, D, I, S, C, *, Total) – the one table every output uses
+        self.rows = (
+            ("Most Likely", *self.most.values(), sum(self.most.values())),
+            ("Least Likely", *self.least.values(), sum(self.least.values())),
+            ("Difference", *self.change.values(), "-", sum(self.change.values())),
+        )
+
+    # -- graphs / PDF --------------------------------------------------
+    def values(self) -> dict:
+        """'most' 'least' 'change' → [D, I, S, C] for the graph plots."""
+        return {
+            "most": [self.most[k] for k in DISC],
+            "least": [self.least[k] for k in DISC],
+            "change": [self.change[k] for k in DISC],
+        }
+
+    def pdf_scores(self) -> dict:
+        """Score table rows in the shape ``build_pdf`` expects."""
+        most, least, change = self.rows
+        return {
+            "most": dict(zip(HEADERS[1:], most[1:])),
+            "least": dict(zip(HEADERS[1:], least[1:])),
+            "change": {**self.change, "*": "-", "Total": " "},
+        }
+
+    # -- email ---------------------------------------------------------
+    def text_table(self) -> str:
+        lines = [_TEXT_SEP, _TEXT_ROW(*HEADERS), _TEXT_HEAD]
+        for row in self.rows:
+            lines += [_TEXT_ROW(*row), _TEXT_SEP]
+        return "\n".join(lines)
+
+    def html_table(self) -> str:
+        head = "".join(f"<th>{h}</th>" for h in HEADERS)
+        body = "\n".join(_HTML_ROW(*row) for row in self.rows)
+        return f"<table>\n<thead>\n<tr>{head}</tr>\n</thead>\n<tbody>\n{body}\n</tbody>\n</table>"
+
+    def email_bodies(self, *, name, email, date_of_birth, gender,
+                     completion_time="n/a", section_times="n/a"):
+        """Plain‑text and HTML email bodies, filled in one pass each."""
+        fields = dict(date_of_birth=date_of_birth, gender=gender,
+                      completion_time=completion_time, section_times=section_times)
+        text = EMAIL_TEXT.substitute(fields, name=name, email=email,
+                                     table=self.text_table())
+        html = EMAIL_HTML.substitute(
+            {k: escape(str(v)) for k, v in fields.items()},
+            name=escape(name), email=escape(email), table=self.html_table())
+        return text, html
+
+    # -- digest / API --------------------------------------------------
+    def compact(self, key: str) -> str:
+        """'6/5/8/4' for the 'most', 'least' or 'change' row."""
+        row = getattr(self, key)
+        return "/".join(str(row[k]) for k in DISC)
+
+    def as_dict(self) -> dict:
+        """JSON‑ready form: most / least / change plus the totals."""
+        return {
+            "most": self.most,
+            "least": self.least,
+            "change": self.change,
+            "totals": {row[0]: row[-1] for row in self.rows},
+        }
@@ -0,0 +1,218 @@
+# session_store.py -----------------------------------------------------
+"""
+Checkpoint in‑progress assessments outside ``st.session_state`` so a
+respondent survives a server restart or lands on another replica.
+
+Every save appends one small JSON record for the session – nothing is
+ever rewritten:
+  {"kind": "details",   "user_details": {...}}
+  {"kind": "section",   "selection": {...}}
+  {"kind": "submitted", "disc_scores_most": {...}, "disc_scores_least": {...}}
+  {"kind": "stored",    "result_id": 42}
+  {"kind": "completed"}          – once the report is sent, or queued
+                                   for the digest in the results DB
+
+Replaying the records rebuilds ``user_details``, ``user_selections``
+and ``current_section`` (or, after Submit, the scores and
+``assessment_completed`` so the results page runs again).  The session
+id travels in the URL (?sid=…), so reopening the link resumes at the
+right place.
+
+Checkpointing is best effort: a store error is logged and the in‑memory
+assessment carries on (it just would not survive a restart).
+
+Pick the backend with DISC_CHECKPOINT_STORE:
+  sqlite:<path>   (default sqlite:disc_checkpoints.sqlite3)
+  file:<dir>      one append‑only .jsonl file per session
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from datetime import date
+from pathlib import Path
+
+import streamlit as st
+
+CHECKPOINT_STORE = os.environ.get("DISC_CHECKPOINT_STORE",
+                                  "sqlite:disc_checkpoints.sqlite3")
+
+# ----------------------------------------------------------------------
+# 1 ─── STORES ──────────────────────────────────────────────────────────
+# ----------------------------------------------------------------------
+
+class CheckpointStore(ABC):
+    """Append‑only record log per session id."""
+
+    @abstractmethod
+    def append(self, session_id: str, record: dict) -> None:
+        """Add one record to the end of the session's log."""
+
+    @abstractmethod
+    def records(self, session_id: str) -> list:
+        """All records for the session, oldest first."""
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+
+    def __init__(self, path):
+        self.path = path
+        conn = self._connect()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS checkpoints ("
+            " seq INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " session_id TEXT NOT NULL,"
+            " record TEXT NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS checkpoints_session"
+                     " ON checkpoints (session_id, seq)")
+        conn.close()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def append(self, session_id, record):
+        conn = self._connect()
+        try:
+            conn.execute("INSERT INTO checkpoints (session_id, record) VALUES (?, ?)",
+                         (session_id, json.dumps(record, default=str)))
+        finally:
+            conn.close()
+
+    def records(self, session_id):
+        conn = self._connect()
+        try:
+            rows = conn.execute("SELECT record FROM checkpoints"
+                                " WHERE session_id = ? ORDER BY seq",
+                                (session_id,)).fetchall()
+        finally:
+            conn.close()
+        return [json.loads(r) for (r,) in rows]
+
+
+class FileCheckpointStore(CheckpointStore):
+
+    def __init__(self, directory):
+        self.dir = Path(directory)
+        self.dir.mkdir(parents=True, exist_ok=True)
+
+    def _file(self, session_id):
+        return self.dir / f"{session_id}.jsonl"
+
+    def append(self, session_id, record):
+        with open(self._file(session_id), "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, default=str) + "\n")
+
+    def records(self, session_id):
+        try:
+            with open(self._file(session_id), encoding="utf-8") as f:
+                return [json.loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_checkpoint_store() -> CheckpointStore:
+    """Return the store configured by DISC_CHECKPOINT_STORE."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            kind, _, target = CHECKPOINT_STORE.partition(":")
+            if kind == "sqlite":
+                _store = SQLiteCheckpointStore(target)
+            elif kind == "file":
+                _store = FileCheckpointStore(target)
+            else:
+                raise ValueError(f"unknown DISC_CHECKPOINT_STORE: {CHECKPOINT_STORE!r}")
+        return _store
+
+# ----------------------------------------------------------------------
+# 2 ─── SESSION GLUE ────────────────────────────────────────────────────
+# ----------------------------------------------------------------------
+
+def replay(records):
+    """Fold a session's records into the state to restore (None if done)."""
+    state = {"user_details": None, "user_selections": [], "current_section": 0,
+             "submitted": None, "result_id": None}
+    by_section = {}
+    for rec in records:
+        if rec["kind"] == "details":
+            state["user_details"] = rec["user_details"]
+            state["current_section"] = max(state["current_section"], 1)
+        elif rec["kind"] == "section":
+            sel = rec["selection"]
+            by_section[sel["section"]] = sel
+            state["current_section"] = max(state["current_section"], sel["section"] + 2)
+        elif rec["kind"] == "submitted":
+            state["submitted"] = rec
+        elif rec["kind"] == "stored":
+            state["result_id"] = rec["result_id"]
+        elif rec["kind"] == "completed":
+            return None
+    state["user_selections"] = [by_section[k] for k in sorted(by_section)]
+    return state if state["user_details"] else None
+
+
+def resume_or_start(n_sections):
+    """
+    Give the session an id (kept in the URL) and, if that id already has
+    checkpoints from an earlier server/replica, restore its progress.
+    """
+    if 'session_id' in st.session_state:
+        return
+
+    sid = st.query_params.get("sid")
+    if sid and not re.fullmatch(r"[0-9a-f]{32}", sid):
+        sid = None          # only ids we issued (also keeps file: paths safe)
+    try:
+        state = replay(get_checkpoint_store().records(sid)) if sid else None
+    except Exception as exc:
+        print('Checkpoint restore failed:', exc)
+        state = None
+
+    if state is None:
+        sid = uuid.uuid4().hex
+        st.query_params["sid"] = sid
+    else:
+        details = state["user_details"]
+        if details.get("date_of_birth"):
+            details["date_of_birth"] = date.fromisoformat(details["date_of_birth"])
+        selections = state["user_selections"]
+        current = state["current_section"]
+        submitted = state["submitted"]
+        if submitted:
+            # submitted but report not yet delivered: rerun the results page
+            current = n_sections
+            st.session_state.disc_scores_most = submitted["disc_scores_most"]
+            st.session_state.disc_scores_least = submitted["disc_scores_least"]
+            st.session_state.assessment_completed = True
+            if state["result_id"] is not None:
+                st.session_state.result_id = state["result_id"]
+        elif current > n_sections:
+            # last answer saved but never submitted: re-ask the last section
+            current = n_sections
+            selections = [s for s in selections if s["section"] < n_sections - 1]
+        st.session_state.user_details = details
+        st.session_state.user_selections = selections
+        st.session_state.current_section = current
+    st.session_state.session_id = sid
+
+
+def checkpoint(kind, **data):
+    """Append one record for the current session (never raises)."""
+    # checkpointing must never break the assessment it is protecting
+    try:
+        get_checkpoint_store().append(st.session_state.session_id,
+                                      {"kind": kind, **data})
+    except Exception as exc:
+        print(f'Checkpoint "{kind}" failed:', exc)
@@ -1,28 +1,28 @@
 import streamlit as st
-import pandas as pd
 import json
 
 from user_details import input_user_details
 from checkbox_change import on_change_checkbox
 from save_selection import save_selections
-from disc_pdf import build_pdf
-
-from graphing import plot_disc_graph_most, plot_disc_graph_least, plot_disc_graph_change
+from render_pool import get_render_pool, render_report, render_preview_svgs, RenderPoolBusy
+from digest import get_digest_queue
+from profiling import profile_run, profiling_requested
+from results_store import save_result
+from session_store import resume_or_start, checkpoint
+from timing import new_section_times, section_durations, fmt_duration
+from score_summary import ScoreSummary
 
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.image import MIMEImage
-from tabulate import tabulate
 import smtplib
 import streamlit as st
 
-import matplotlib.pyplot as plt
 import os 
+from datetime import datetime
+from functools import partial
 from email.mime.application import MIMEApplication
-
-# Dimensions for DISC graphs in points (1 pt = 1 px @ 300 dpi)
-FIGSIZE_PT = (600, 800)
-FIGSIZE_IN = (FIGSIZE_PT[0] / 300, FIGSIZE_PT[1] / 300)
+from concurrent.futures.process import BrokenProcessPool
 
 # Load mappings from JSON file
 with open('disc_mappings.json', 'r') as f:
@@ -65,113 +65,142 @@ if 'user_selections' not in st.session_state:
 if 'assessment_completed' not in st.session_state:
     st.session_state.assessment_completed = False  # Initialize assessment completion status
 
+if 'section_times' not in st.session_state:
+    st.session_state.section_times = new_section_times(len(all_mappings))  # monotonic stamps per section
+
+# Restore an in-progress assessment checkpointed by another server/replica
+resume_or_start(len(all_mappings))
+
+# Opt-in profiling of the completion path (env switch or admin URL token)
+profiling = profiling_requested(st.query_params)
+
 # Initialize the keys for checkboxes
 st.session_state.checkbox_keys = [[[], []] for _ in all_mappings]  # Adjust lists based on the number of mappings
 
-def auto_mail_results(user_name, user_email):
-    # Access secrets from the secrets.toml file
-    me = st.secrets["email"]["me"]
-    password = st.secrets["email"]["password"]
-    you = st.secrets["email"]["you"]
-    server = st.secrets["email"]["server"]
-
-    # Prepare DISC data for the table
-    data = [
-        ["Category", "D", "I", "S", "C", "*", "Total"],
-        ["Most Likely", st.session_state.disc_scores_most['D'], st.session_state.disc_scores_most['I'], st.session_state.disc_scores_most['S'], st.session_state.disc_scores_most['C'], st.session_state.disc_scores_most['*'], sum(st.session_state.disc_scores_most.values())],
-        ["Least Likely", st.session_state.disc_scores_least['D'], st.session_state.disc_scores_least['I'], st.session_state.disc_scores_least['S'], st.session_state.disc_scores_least['C'], st.session_state.disc_scores_least['*'], sum(st.session_state.disc_scores_least.values())],
-        ["Difference", st.session_state.disc_scores_most['D'] - st.session_state.disc_scores_least['D'], st.session_state.disc_scores_most['I'] - st.session_state.disc_scores_least['I'], st.session_state.disc_scores_most['S'] - st.session_state.disc_scores_least['S'], st.session_state.disc_scores_most['C'] - st.session_state.disc_scores_least['C'], "-", (st.session_state.disc_scores_most['D'] - st.session_state.disc_scores_least['D']) + (st.session_state.disc_scores_most['I'] - st.session_state.disc_scores_least['I']) + (st.session_state.disc_scores_most['S'] - st.session_state.disc_scores_least['S']) + (st.session_state.disc_scores_most['C'] - st.session_state.disc_scores_least['C'])]
-    ]
+def send_email(message, email_secrets):
+    me = email_secrets["me"]
+    password = email_secrets["password"]
+    you = email_secrets["you"]
+    server = email_secrets["server"]
 
-    # Create plain text and HTML versions of the message
-    text = f"""
-    This is confirmation of the completion of the DISC Assessment by {user_name}.
-    
-    Contact {user_name} email: {user_email}.
-    Date of Birth: {st.session_state.user_details['date_of_birth']}
-    Gender: {st.session_state.user_details['gender']}
-    
-    DISC Results:
+    message['From'] = me
+    message['To'] = you
 
-    {tabulate(data, headers="firstrow", tablefmt="grid")}
+    smtp_server = smtplib.SMTP(server)
+    smtp_server.ehlo()
+    smtp_server.starttls()
+    smtp_server.login(me, password)
+    smtp_server.sendmail(me, you, message.as_string())
+    smtp_server.quit()
 
-    """
+def auto_mail_results(user_name, user_email, summary):
+    # Access secrets from the secrets.toml file
+    email_secrets = st.secrets["email"]
+    details = st.session_state.user_details
+
+    # Time taken, derived from the stamps recorded on each section save
+    durations = section_durations(st.session_state.section_times)
+
+    # Graphs + PDF are rendered in the shared worker pool, not on this thread.
+    # A job that timed out earlier is still ours: wait on it again on retry.
+    pool = get_render_pool()
+    future = st.session_state.get('report_future')
+    if future is None or future.cancelled() or (future.done() and future.exception()):
+        future = st.session_state.report_future = pool.submit(
+            render_report,
+            user = {
+                "name":   user_name,
+                "email":  user_email,
+                "date":   details["date_of_birth"],
+                "gender": details["gender"],
+            },
+            values = summary.values(),
+            scores = summary.pdf_scores(),
+            timings = durations,
+            profile = profiling,
+        )
+    with st.spinner("Preparing your DISC report..."):
+        pdf_bytes = pool.wait(future)
+    del st.session_state.report_future
+
+    # Digest mode: queue the report, one combined email goes out per window.
+    # The queue keeps it in the results DB until sent, so it needs the row id;
+    # without one (or if that write fails) the report is emailed directly.
+    if email_secrets.get("delivery", "immediate") == "digest" \
+            and st.session_state.get('result_id') is not None:
+        try:
+            get_digest_queue(
+                partial(send_email, email_secrets=dict(email_secrets)),
+                max_count=int(email_secrets.get("digest_max_count", 25)),
+                window_s=60 * float(email_secrets.get("digest_window_minutes", 60)),
+            ).add({
+                "result_id":    st.session_state.result_id,
+                "name":         user_name,
+                "email":        user_email,
+                "completed_at": datetime.now(),
+                "summary":      summary,
+                "pdf":          pdf_bytes,
+            })
+            print('Results queued for digest email')
+            return
+        except Exception as exc:
+            print('Digest queue unavailable, emailing directly:', exc)
 
-    html = f"""
-    <html><body><p>This is confirmation of the completion of the DISC Assessment by {user_name}.</p>
-    <p>Email: {st.session_state.user_details['user_email']}</p>
-    <p>Date of Birth: {st.session_state.user_details['date_of_birth']}</p>
-    <p>Gender: {st.session_state.user_details['gender']}</p>
-    {tabulate(data, headers="firstrow", tablefmt="html")}
-    <p>See attached PDF for the plotted DISC scores.</p>
-    </body></html>
-    """
+    # Create plain text and HTML versions of the message
+    text, html = summary.email_bodies(
+        name=user_name,
+        email=user_email,
+        date_of_birth=details["date_of_birth"],
+        gender=details["gender"],
+        completion_time=fmt_duration(durations["total"]),
+        section_times=", ".join(f"{i}: {fmt_duration(s)}" for i, s in enumerate(durations["sections"], start=1)),
+    )
 
     # Construct the email
     message = MIMEMultipart("related")
     message['Subject'] = f"DISC Assessment Results | {user_name}"
-    message['From'] = me
-    message['To'] = you
 
     # Attach text and HTML versions of the email
     message_alternative = MIMEMultipart("alternative")
     message.attach(message_alternative)
     message_alternative.attach(MIMEText(text, 'plain'))
     message_alternative.attach(MIMEText(html, 'html'))
-    
-    fig, ax = plt.subplots(figsize=FIGSIZE_IN, dpi=300)   # 1 pt == 1 px
-    paths = {}
-    
-    for scores, fn, key in [
-        (most_likely_scores,  plot_disc_graph_most,   "most"),
-        (least_likely_scores, plot_disc_graph_least,  "least"),
-        (difference_scores,   plot_disc_graph_change, "change"),
-    ]:
-    
-        fig, ax = plt.subplots(figsize=FIGSIZE_IN, dpi=300)   # 1 pt == 1 px
-        fn(scores, ax)
-        path = f"/tmp/{key}.png"
-        fig.savefig(path, bbox_inches="tight", transparent=True)
-        plt.close(fig)
-        paths[key] = path
-        
-    # -------- build a dict the PDF layer can consume -----------------
-    scores = {
-        "most":   {**st.session_state.disc_scores_most,
-                   "Total": sum(st.session_state.disc_scores_most.values())},
-        "least":  {**st.session_state.disc_scores_least,
-                   "Total": sum(st.session_state.disc_scores_least.values())},
-        "change": {"D": diff_D, "I": diff_I, "S": diff_S, "C": diff_C,
-                   "*": "-",   "Total": " "},
-    }
-    
-    pdf_path = build_pdf(
-        user = {
-            "name":   user_name,
-            "email":  user_email,
-            "date":   st.session_state.user_details["date_of_birth"],
-            "gender": st.session_state.user_details["gender"],
-        },
-        graphs = paths,
-        scores = scores,
-        out_path = "/tmp/DISC_Report.pdf",
-    )
-    
-    with open(pdf_path, "rb") as f:
-        part = MIMEApplication(f.read(), _subtype='pdf')
+
+    part = MIMEApplication(pdf_bytes, _subtype='pdf')
     part.add_header('Content-Disposition', 'attachment', filename="DISC_Report.pdf")
     message.attach(part)
     
     # Send the email
-    smtp_server = smtplib.SMTP(server)
-    smtp_server.ehlo()
-    smtp_server.starttls()
-    smtp_server.login(me, password)
-    smtp_server.sendmail(me, you, message.as_string())
-    smtp_server.quit()
+    send_email(message, email_secrets)
     print('Email sent successfully')
     
 
+# SVG previews keyed by the score tuples, shared by every session on this server
+@st.cache_data(max_entries=256, show_spinner=False)
+def preview_svgs(most, least, change):
+    return get_render_pool().run(
+        render_preview_svgs,
+        values={"most": list(most), "least": list(least), "change": list(change)},
+    )
+
+def show_results_preview(summary):
+    # Rendered at most once per session; reruns reuse the markup
+    if 'preview_svgs' not in st.session_state:
+        values = summary.values()
+        try:
+            st.session_state.preview_svgs = preview_svgs(
+                tuple(values["most"]), tuple(values["least"]), tuple(values["change"]))
+        except Exception as exc:
+            # preview is a nice-to-have, the emailed report is what matters
+            print('Results preview failed:', exc)
+            return
+
+    for col, key, title in zip(st.columns(3), ("most", "least", "change"),
+                               ("Graph 1 MOST", "Graph 2 LEAST", "Graph 3 CHANGE")):
+        with col:
+            st.caption(title)
+            st.image(st.session_state.preview_svgs[key], use_column_width=True)
+
 # Calculate DISC scores after saving selections
 def calculate_disc_scores():
     # Initialize DISC scores
@@ -246,47 +275,53 @@ elif not st.session_state.assessment_completed:
             if st.button("Submit"):
                 save_selections(idx)
                 # Reset DISC scores before calculation
-                calculate_disc_scores()
+                with profile_run("scores", enabled=profiling):
+                    calculate_disc_scores()
                 st.session_state.assessment_completed = True
+                checkpoint("submitted",
+                           disc_scores_most=st.session_state.disc_scores_most,
+                           disc_scores_least=st.session_state.disc_scores_least)
                 st.rerun()  # Force a rerun to display the result
     else: 
         st.error("Please make a selection for both 'Most Likely' and 'Least Likely' options.")
 
 else:
-    # Calculate the sum for each row
-    sum_most = sum(st.session_state.disc_scores_most.values())
-    sum_least = sum(st.session_state.disc_scores_least.values())
-
-    # Calculate the difference between Most Likely and Least Likely (excluding the * column)
-    diff_D = st.session_state.disc_scores_most["D"] - st.session_state.disc_scores_least["D"]
-    diff_I = st.session_state.disc_scores_most["I"] - st.session_state.disc_scores_least["I"]
-    diff_S = st.session_state.disc_scores_most["S"] - st.session_state.disc_scores_least["S"]
-    diff_C = st.session_state.disc_scores_most["C"] - st.session_state.disc_scores_least["C"]
-    diff_total = diff_D + diff_I + diff_S + diff_C
-
-    # Prepare data for the table including the sum and difference row
-    data = {
-        "Category": ["Most Likely", "Least Likely", "Difference"],
-        "D": [st.session_state.disc_scores_most["D"], st.session_state.disc_scores_least["D"], diff_D],
-        "I": [st.session_state.disc_scores_most["I"], st.session_state.disc_scores_least["I"], diff_I],
-        "S": [st.session_state.disc_scores_most["S"], st.session_state.disc_scores_least["S"], diff_S],
-        "C": [st.session_state.disc_scores_most["C"], st.session_state.disc_scores_least["C"], diff_C],
-        "*": [st.session_state.disc_scores_most["*"], st.session_state.disc_scores_least["*"], "-"],  # Exclude * from Difference calculation
-        "Total": [sum_most, sum_least, diff_total]  # Add the sum as the final column
-    }
-
-    df = pd.DataFrame(data)
-        
-    # Plot the line graphs
-    categories = ["D", "I", "S", "C"]
-    most_likely_scores = [st.session_state.disc_scores_most[cat] for cat in categories]
-    least_likely_scores = [st.session_state.disc_scores_least[cat] for cat in categories]
-    difference_scores = [diff_D, diff_I, diff_S, diff_C]
+    # One score summary feeds the email, digest, PDF and preview
+    summary = ScoreSummary(st.session_state.disc_scores_most, st.session_state.disc_scores_least)
     
+    # Keep a local record for analysts (once per session, not on every rerun).
+    # Best effort: the emailed report is the system of record, so a failed
+    # write is logged and delivery goes ahead (result_id None = not stored).
+    if 'result_id' not in st.session_state:
+        try:
+            st.session_state.result_id = save_result(
+                user=st.session_state.user_details,
+                selections=st.session_state.user_selections,
+                most=summary.most,
+                least=summary.least,
+                durations=section_durations(st.session_state.section_times),
+            )
+        except Exception as exc:
+            print('Storing results failed:', exc)
+            st.session_state.result_id = None
+        else:
+            checkpoint("stored", result_id=st.session_state.result_id)
+
     # Thank you message
     user_name = st.session_state.user_details['name']
     user_email = st.session_state.user_details['user_email']
-    auto_mail_results(user_name, user_email)
+    # Deliver once per session: reruns (reconnects, "Try again") must not resend
+    if 'report_sent' not in st.session_state:
+        try:
+            with profile_run("mail", enabled=profiling):
+                auto_mail_results(user_name, user_email, summary)
+        except (RenderPoolBusy, TimeoutError, BrokenProcessPool):
+            st.error("We are generating a lot of reports right now and yours could not be prepared. Please try again in a moment.")
+            st.button("Try again")  # any click reruns the results branch
+            st.stop()
+        st.session_state.report_sent = True  # only after a successful send / queue
+        checkpoint("completed")  # terminal (sent, or queued on disk): a later visit starts anew
     st.write(f"### Thank you, {user_name}, for completing the assessment!")
     st.write(f"Your results have been sent to Dino. He will be in contact through {user_email}.")
     st.write("If you have any questions, do not hesitate to reach out at: dino@dino-griffin.com .") 
+    show_results_preview(summary)
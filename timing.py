@@ -0,0 +1,90 @@
+# timing.py ------------------------------------------------------------
+"""
+How long respondents take (the form asks for ~7 minutes).
+
+During the assessment ``st.session_state.section_times`` is a fixed
+``array('d')`` of monotonic stamps: slot 0 when the details page is left,
+slot i+1 when section i is saved.  Recording is one float store – no
+reruns, no I/O.  Durations are derived only when the report is built.
+
+Distribution across stored results:
+------------------------------------------------------------------
+python timing.py                # uses DISC_RESULTS_DB
+------------------------------------------------------------------
+"""
+
+import time
+from array import array
+from statistics import median, quantiles
+
+
+def new_section_times(n_sections):
+    return array('d', [0.0]) * (n_sections + 1)   # 0.0 = not stamped
+
+
+def stamp(times, slot):
+    times[slot] = time.monotonic()
+
+
+def section_durations(times):
+    """
+    Per‑section seconds (None where a stamp is missing, e.g. after a
+    resume on another replica) and the total – None unless every slot
+    was stamped, so a resumed session never reports a partial span.
+    """
+    sections = [
+        round(b - a, 1) if a and b else None
+        for a, b in zip(times, times[1:])
+    ]
+    total = round(times[-1] - times[0], 1) if all(times) else None
+    return {"total": total, "sections": sections}
+
+
+def fmt_duration(seconds):
+    if seconds is None:
+        return "n/a"
+    m, s = divmod(int(round(seconds)), 60)
+    return f"{m}m {s:02d}s" if m else f"{s}s"
+
+
+def _summary(values):
+    values = sorted(v for v in values if v is not None)
+    if len(values) < 2:
+        return {"count": len(values)}
+    p25, _, p75 = quantiles(values, n=4)
+    return {
+        "count": len(values),
+        "min": values[0],
+        "p25": round(p25, 1),
+        "median": round(median(values), 1),
+        "p75": round(p75, 1),
+        "p90": round(quantiles(values, n=10)[-1], 1),
+        "max": values[-1],
+    }
+
+
+def timing_distribution(db_path=None):
+    """Summary stats of total and per‑section durations across results."""
+    # imported here so the PDF render workers (fmt_duration) skip sqlite
+    from results_store import N_SECTIONS, RESULTS_DB, iter_results
+
+    db_path = db_path or RESULTS_DB
+    totals = []
+    per_section = [[] for _ in range(N_SECTIONS)]
+    for chunk in iter_results(db_path=db_path):
+        for row in chunk:
+            totals.append(row["total_seconds"])
+            for i, secs in enumerate(per_section, start=1):
+                secs.append(row[f"q{i:02d}_seconds"])
+    return {"total": _summary(totals),
+            "sections": [_summary(v) for v in per_section]}
+
+
+if __name__ == "__main__":
+    dist = timing_distribution()
+    cols = ("count", "min", "p25", "median", "p75", "p90", "max")
+    print(f"{'':>8}" + "".join(f"{c:>8}" for c in cols))
+    rows = [("total", dist["total"])] + [
+        (f"q{i:02d}", s) for i, s in enumerate(dist["sections"], start=1)]
+    for name, s in rows:
+        print(f"{name:>8}" + "".join(f"{s.get(c, ''):>8}" for c in cols))
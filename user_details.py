@@ -1,5 +1,7 @@
 import streamlit as st
 from datetime import date, datetime
+from session_store import checkpoint
+from timing import stamp
 
 # Function to handle the first section for user details
 def input_user_details():
@@ -29,5 +31,7 @@ def input_user_details():
     if next_button_clicked and not st.session_state.user_details['name'] or not st.session_state.user_details['user_email']:
         st.error("Name and Email is required to proceed.")
     elif next_button_clicked:
+        checkpoint("details", user_details=dict(st.session_state.user_details))
+        stamp(st.session_state.section_times, 0)  # assessment clock starts
         st.session_state.current_section = 1  # Move to the first question of the DISC assessment
         st.rerun()